@@ -1,2 +1,3 @@
 ENCRYPTION_V1_DEFAULT_KEY = "default"
 ENCRYPTION_V2_DEFAULT_KEY = "DEFAULT"
+STATIC_KEY_PROVIDER_ID = "static"
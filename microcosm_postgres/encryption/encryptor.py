@@ -2,7 +2,9 @@
 Implement application-layer encryption using the aws-encryption-sdk.
 
 """
+from functools import cached_property, lru_cache
 from typing import (
+    Callable,
     Mapping,
     Sequence,
     Tuple,
@@ -14,7 +16,7 @@ from aws_encryption_sdk.materials_managers.base import CryptoMaterialsManager
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, hmac
 
-from microcosm_postgres.encryption.constants import ENCRYPTION_V1_DEFAULT_KEY
+from microcosm_postgres.encryption.constants import ENCRYPTION_V1_DEFAULT_KEY, STATIC_KEY_PROVIDER_ID
 from microcosm_postgres.encryption.v2.beacons import BeaconHashAlgorithm
 
 
@@ -31,10 +33,14 @@ class SingleTenantEncryptor:
     ):
         self.encrypting_materials_manager = encrypting_materials_manager
         self.decrypting_materials_manager = decrypting_materials_manager
+        self._configure(beacon_key)
+
+    def _configure(self, beacon_key: str | None) -> None:
         self.encryption_client = EncryptionSDKClient(
             commitment_policy=CommitmentPolicy.FORBID_ENCRYPT_ALLOW_DECRYPT,
         )
         self._beacon_key = beacon_key.encode("utf-8") if beacon_key else None
+        self._beacon_hmac = hmac.HMAC(self._beacon_key, hashes.SHA256()) if self._beacon_key else None
 
     def __contains__(self, encryption_context_key: str) -> bool:
         return True
@@ -53,14 +59,10 @@ class SingleTenantEncryptor:
         if self.encrypting_materials_manager is None:
             return None
 
-        encryption_context = dict(
-            microcosm=encryption_context_key,
-        )
-
         ciphertext, header = self.encryption_client.encrypt(
             source=plaintext,
             materials_manager=self.encrypting_materials_manager,
-            encryption_context=encryption_context,
+            encryption_context=_encryption_context(encryption_context_key),
         )
 
         key_ids = [
@@ -77,6 +79,20 @@ class SingleTenantEncryptor:
         )
         return plaintext.decode("utf-8")
 
+    def decrypt_many(self, encryption_context_key: str, ciphertexts: Sequence[bytes]) -> list[str]:
+        """
+        Decrypt many ciphertexts with the same client and materials manager.
+
+        Rows sharing a data key only unwrap it once when the materials manager caches.
+
+        """
+        decrypt = self.encryption_client.decrypt
+        materials_manager = self.decrypting_materials_manager
+        return [
+            decrypt(source=ciphertext, materials_manager=materials_manager)[0].decode("utf-8")
+            for ciphertext in ciphertexts
+        ]
+
     def beacon(self, value: str, algorithm: BeaconHashAlgorithm | None = None) -> str | None:
         if algorithm in [BeaconHashAlgorithm.SHA_256, None]:
             # Note that this is the default behaviour
@@ -86,57 +102,119 @@ class SingleTenantEncryptor:
             return digest.finalize().hex()
 
         elif algorithm == BeaconHashAlgorithm.HMAC_SHA_256:
-            if self._beacon_key is None:
+            if self._beacon_hmac is None:
                 return None
 
-            h = hmac.HMAC(self._beacon_key, hashes.SHA256())
+            # Copy the keyed context rather than re-keying the HMAC for every value
+            h = self._beacon_hmac.copy()
             h.update(value.encode("utf-8"))
             return h.finalize().hex()
 
         else:
             return None
 
+    def beacon_many(
+        self,
+        values: Sequence[str],
+        algorithm: BeaconHashAlgorithm | None = None,
+    ) -> list[str | None]:
+        return [self.beacon(value, algorithm=algorithm) for value in values]
+
     def unpack_key_id(self, key_provider):
-        key_info = key_provider.key_info
-        try:
-            # KMS case: the wrapped key id *is* the key id
-            return key_info.decode("utf-8")
-        except UnicodeDecodeError:
+        if key_provider.provider_id == STATIC_KEY_PROVIDER_ID:
             # static case: the wrapped key id is the key id followed by two four byte integers (tags)
             # followed by a twelve byte initialization vectors (IV)
             #
             # see: aws_encryption_sdk.internal.formatting.serialize:serialize_wrapped_key
+            return key_provider.key_info[:-(4 + 4 + 12)].decode("utf-8")
+
+        key_info = key_provider.key_info
+        if key_info.isascii():
+            # KMS case: the wrapped key id *is* the key id (an ASCII ARN) and repeats across values
+            return _decode_ascii_key_id(key_info)
+
+        try:
+            return key_info.decode("utf-8")
+        except UnicodeDecodeError:
+            # unknown provider; assume the static wrapping layout
             return key_info[:-(4 + 4 + 12)].decode("utf-8")
 
 
+class LazySingleTenantEncryptor(SingleTenantEncryptor):
+    """
+    A single tenant encryptor that builds its materials managers on first use.
+
+    Materials managers (and their KMS clients) are relatively expensive to create; deferring
+    them keeps startup time independent of the number of configured tenants.
+
+    """
+    def __init__(
+        self,
+        encrypting_materials_manager_factory: Callable[[], CryptoMaterialsManager] | None,
+        decrypting_materials_manager_factory: Callable[[], CryptoMaterialsManager],
+        beacon_key: str | None = None
+    ):
+        self.encrypting_materials_manager_factory = encrypting_materials_manager_factory
+        self.decrypting_materials_manager_factory = decrypting_materials_manager_factory
+        self._configure(beacon_key)
+
+    @cached_property
+    def encrypting_materials_manager(self) -> CryptoMaterialsManager | None:  # type: ignore[override]
+        if self.encrypting_materials_manager_factory is None:
+            return None
+        return self.encrypting_materials_manager_factory()
+
+    @cached_property
+    def decrypting_materials_manager(self) -> CryptoMaterialsManager:  # type: ignore[override]
+        return self.decrypting_materials_manager_factory()
+
+
+@lru_cache(maxsize=1024)
+def _encryption_context(encryption_context_key: str) -> Mapping[str, str]:
+    # NB: the aws-encryption-sdk copies the encryption context before adding to it,
+    # so the same (cached) dictionary can be shared between calls
+    return dict(
+        microcosm=encryption_context_key,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _decode_ascii_key_id(key_info: bytes) -> str:
+    return key_info.decode("ascii")
+
+
 class MultiTenantEncryptor:
 
     def __init__(self,
                  encryptors: Mapping[str, SingleTenantEncryptor],
                  default_key=ENCRYPTION_V1_DEFAULT_KEY):
-        self.encryptors = encryptors
         self.default_key = default_key
+        self.encryptors = encryptors
+
+    @property
+    def encryptors(self) -> Mapping[str, SingleTenantEncryptor]:
+        return self._encryptors
+
+    @encryptors.setter
+    def encryptors(self, encryptors: Mapping[str, SingleTenantEncryptor]) -> None:
+        # resolve the default encryptor once so that lookups are a single `dict.get`
+        self._encryptors = encryptors
+        self._default_encryptor = encryptors.get(self.default_key)
 
     def __contains__(self, encryption_context_key: str) -> bool:
-        return encryption_context_key in self.encryptors or self.default_key in self.encryptors
+        return self._default_encryptor is not None or encryption_context_key in self._encryptors
 
     def __getitem__(self, encryption_context_key: str) -> SingleTenantEncryptor | None:
-        try:
-            return self.encryptors[encryption_context_key]
-        except KeyError:
-            try:
-                return self.encryptors[self.default_key]
-            except KeyError:
-                return None
+        return self._encryptors.get(encryption_context_key, self._default_encryptor)
 
     def encrypt(self, encryption_context_key: str, plaintext: str) -> Tuple[bytes, Sequence[str]] | None:
-        encryptor = self[encryption_context_key]
+        encryptor = self._encryptors.get(encryption_context_key, self._default_encryptor)
         if encryptor is None:
             return None
         return encryptor.encrypt(encryption_context_key, plaintext)
 
     def decrypt(self, encryption_context_key: str, ciphertext: bytes) -> str | None:
-        encryptor = self[encryption_context_key]
+        encryptor = self._encryptors.get(encryption_context_key, self._default_encryptor)
         if encryptor is None:
             return None
         return encryptor.decrypt(encryption_context_key, ciphertext)
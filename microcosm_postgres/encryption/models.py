@@ -2,6 +2,7 @@
 Encryption-related models.
 
 """
+from functools import lru_cache
 from typing import (
     Callable,
     Dict,
@@ -12,9 +13,33 @@ from typing import (
 
 from sqlalchemy import Column, LargeBinary, String
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.event import contains, listen, remove
+from sqlalchemy.event import listen
 
-from microcosm_postgres.encryption.encryptor import Encryptor
+from microcosm_postgres.encryption.encryptor import Encryptor, MultiTenantEncryptor
+
+
+MISSING = object()
+
+
+@lru_cache(maxsize=1024, typed=True)
+def context_key_to_str(encryption_context_key) -> str:
+    """
+    Convert a (non-string) encryption context key, such as a UUID, to its string form.
+
+    Context keys repeat across many rows, so conversions are cached.
+
+    """
+    return str(encryption_context_key)
+
+
+def encrypts_any(encryptor: Optional[Encryptor]) -> bool:
+    """
+    Whether the encryptor can encrypt any context key.
+
+    Resolved on every call: a multi-tenant encryptor's encryptors may be replaced after registration.
+
+    """
+    return not isinstance(encryptor, MultiTenantEncryptor) or bool(encryptor.encryptors)
 
 
 def on_init(target: "EncryptableMixin", args, kwargs):
@@ -31,17 +56,27 @@ def on_init(target: "EncryptableMixin", args, kwargs):
     encryptor = target.__encryptor__
     assert encryptor is not None
 
+    # nothing to do if no context key is configured for encryption
+    if not encrypts_any(encryptor):
+        return
+
     # encryption context may be nullable
-    try:
-        encryption_context_key = str(kwargs[target.__encryption_context_key__])
-    except KeyError:
+    encryption_context_key = kwargs.get(target.__encryption_context_key__, MISSING)
+    if encryption_context_key is MISSING:
         return
 
+    if type(encryption_context_key) is not str:
+        encryption_context_key = context_key_to_str(encryption_context_key)
+
     # do not encrypt targets that are not configured for it
     if encryption_context_key not in encryptor:
         return
 
-    plaintext = target.plaintext_to_str(kwargs.pop(target.__plaintext__))
+    plaintext = kwargs.pop(target.__plaintext__, MISSING)
+    if plaintext is MISSING:
+        return
+
+    plaintext = target.plaintext_to_str(plaintext)
 
     # do not try to encrypt when plaintext is None
     if plaintext is None:
@@ -60,6 +95,10 @@ def on_load(target: "EncryptableMixin", context):
     Intercept SQLAlchemy's instance load event.
 
     """
+    # nothing to do if no context key is configured for encryption
+    if not encrypts_any(target.__encryptor__):
+        return
+
     decrypt, plaintext = decrypt_instance(target)
     if decrypt:
         target.plaintext = plaintext  # type: ignore
@@ -69,16 +108,23 @@ def decrypt_instance(target: "EncryptableMixin") -> Tuple[bool, Optional[str]]:
     encryptor: Encryptor = target.__encryptor__  # type: ignore
 
     # encryption context may be nullable
-    if target.encryption_context_key is None:
+    encryption_context_key = target.encryption_context_key
+    if encryption_context_key is None:
         return (False, None)
 
-    encryption_context_key = str(target.encryption_context_key)
+    if type(encryption_context_key) is not str:
+        encryption_context_key = context_key_to_str(encryption_context_key)
 
     # do not decrypt targets that are not configured for it
-    if (encryption_context_key not in encryptor) or (target.ciphertext is None):
+    if encryption_context_key not in encryptor:
+        return (False, None)
+
+    # NB: `ciphertext` is usually a property that traverses the encrypted relationship
+    encrypted = target.ciphertext
+    if encrypted is None:
         return (False, None)
 
-    ciphertext, key_ids = target.ciphertext
+    ciphertext, key_ids = encrypted
     decrypted_str = encryptor.decrypt(encryption_context_key, ciphertext)
     return (True, target.str_to_plaintext(decrypted_str))  # type: ignore
 
@@ -108,6 +154,7 @@ class EncryptableMixin:
     __encrypted_relationship__ = "encrypted"
     __encryption_context_key__ = "key"
     __plaintext__ = "value"
+    __encryption_listeners_installed__ = False
 
     @property
     def encrypted_identifier(self) -> str:
@@ -156,6 +203,15 @@ class EncryptableMixin:
         # save the current encryptor statically
         cls.__encryptor__ = encryptor
 
+        # If we initialize the graph multiple times (as in many unit testing scenarios),
+        # we would accumulate listener functions -- with unpredictable results. As protection,
+        # listeners are installed only once per class; this solution only works because the
+        # listeners are not closures around the `encryptor` reference.
+        #
+        # Hence the `__encryptor__` hack above...
+        if cls.__dict__.get("__encryption_listeners_installed__", False):
+            return
+
         # NB: we cannot use the before_insert listener in conjunction with a foreign key relationship
         # for encrypted data; SQLAlchemy will warn about using 'related attribute set' operation so
         # late in its insert/flush process.
@@ -165,17 +221,10 @@ class EncryptableMixin:
         )
 
         for name, func in listeners.items():
-            # If we initialize the graph multiple times (as in many unit testing scenarios),
-            # we will accumulate listener functions -- with unpredictable results. As protection,
-            # we need to remove existing listeners before adding new ones; this solution only
-            # works if the id (e.g. memory address) of the listener does not change, which means
-            # they cannot be closures around the `encryptor` reference.
-            #
-            # Hence the `__encryptor__` hack above...
-            if contains(cls, name, func):
-                remove(cls, name, func)
             listen(cls, name, func, restore_load_context=True)
 
+        cls.__encryption_listeners_installed__ = True
+
 
 class EncryptedMixin:
     """
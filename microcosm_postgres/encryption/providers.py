@@ -26,6 +26,8 @@ from microcosm.api import defaults
 from microcosm.config.types import boolean
 from microcosm.config.validation import typed
 
+from microcosm_postgres.encryption.constants import STATIC_KEY_PROVIDER_ID
+
 
 class RestrictedKMSMasterKey(KMSMasterKey):
     """
@@ -90,7 +92,7 @@ class StaticMasterKeyProvider(RawMasterKeyProvider):
 
     @property
     def provider_id(self) -> str:
-        return "static"
+        return STATIC_KEY_PROVIDER_ID
 
     def _get_raw_key(self, key_id) -> WrappingKey:
         return WrappingKey(
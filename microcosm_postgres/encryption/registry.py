@@ -2,6 +2,8 @@
 A registry for context keys and their master key ids.
 
 """
+from functools import partial
+from itertools import chain, repeat
 from typing import Mapping, Sequence, Union
 
 from microcosm.api import defaults
@@ -10,7 +12,11 @@ from microcosm.config.validation import typed
 from microcosm_logging.decorators import logger
 
 from microcosm_postgres.encryption.constants import ENCRYPTION_V2_DEFAULT_KEY
-from microcosm_postgres.encryption.encryptor import MultiTenantEncryptor, SingleTenantEncryptor
+from microcosm_postgres.encryption.encryptor import (
+    LazySingleTenantEncryptor,
+    MultiTenantEncryptor,
+    SingleTenantEncryptor,
+)
 from microcosm_postgres.encryption.providers import (
     configure_decrypting_key_provider,
     configure_encrypting_key_provider,
@@ -18,6 +24,10 @@ from microcosm_postgres.encryption.providers import (
 )
 
 
+def _split(value: Union[str, Sequence[str]]) -> Sequence[str]:
+    return value.split(";") if isinstance(value, str) else value
+
+
 def parse_config(
     context_keys: Sequence[str],
     key_ids: Sequence[Union[str, Sequence[str]]],
@@ -26,19 +36,28 @@ def parse_config(
     restricted_kms_policy: Sequence[str],
     beacon_keys: Sequence[str] | None = None,
 ) -> Mapping[str, Mapping[str, Union[str, Sequence[str], bool, None]]]:
-    _beacon_keys: Sequence[str] = [] if beacon_keys is None else beacon_keys
-    config = {}
+    # optional settings are padded so that every context key has a value
+    padded_beacon_keys = chain(beacon_keys or (), repeat(None))
+    padded_restricted_kms_policy = chain(restricted_kms_policy, repeat("false"))
 
-    for ix, context_config in enumerate(zip(context_keys, key_ids, account_ids, partitions)):
-        context_key, key_id, account_id, partition = context_config
-        config[context_key] = {
+    config = {
+        context_key: {
             # NB: split key id on non-comma to avoid confusion with config parsing
-            "key_ids": key_id.split(";") if isinstance(key_id, str) else key_id,
-            "account_ids": account_id.split(";") if isinstance(account_id, str) else account_id,
+            "key_ids": _split(key_id),
+            "account_ids": _split(account_id),
             "partition": partition,
-            "beacon_key": _beacon_keys[ix] if ix < len(_beacon_keys) and _beacon_keys[ix] else None,
-            "restricted": restricted_kms_policy[ix] == "true" if ix < len(restricted_kms_policy) else False,
+            "beacon_key": beacon_key or None,
+            "restricted": restricted == "true",
         }
+        for context_key, key_id, account_id, partition, beacon_key, restricted in zip(
+            context_keys,
+            key_ids,
+            account_ids,
+            partitions,
+            padded_beacon_keys,
+            padded_restricted_kms_policy,
+        )
+    }
 
     return config
 
@@ -91,29 +110,23 @@ class MultiTenantKeyRegistry:
         self.all_beacon_keys = all_beacon_keys
 
     def make_encryptor(self, graph) -> MultiTenantEncryptor:
-        encryptors = {
-            context_key: SingleTenantEncryptor(
-                encrypting_materials_manager=configure_materials_manager(
+        encryptors: dict[str, SingleTenantEncryptor] = {}
+        for context_key, context_data in self.keys.items():
+            encryptors[context_key] = LazySingleTenantEncryptor(
+                encrypting_materials_manager_factory=partial(
+                    self._make_encrypting_materials_manager,
                     graph,
-                    key_provider=configure_encrypting_key_provider(
-                        graph,
-                        key_ids=context_data["key_ids"],
-                        restricted=context_data["restricted"],
-                    ),
+                    context_data,
                 ),
-                decrypting_materials_manager=configure_materials_manager(
+                decrypting_materials_manager_factory=partial(
+                    self._make_decrypting_materials_manager,
                     graph,
-                    key_provider=configure_decrypting_key_provider(
-                        graph,
-                        context_data["account_ids"],
-                        context_data["partition"],
-                        context_data["key_ids"],
-                    ),
+                    context_data["account_ids"],
+                    context_data["partition"],
+                    context_data["key_ids"],
                 ),
                 beacon_key=context_data["beacon_key"],
             )
-            for context_key, context_data in self.keys.items()
-        }
 
         if len(self.all_account_ids) > 0 and len(self.all_key_ids) > 0:
             # We'll only create a default encryptor if we have at least one
@@ -125,16 +138,14 @@ class MultiTenantKeyRegistry:
                 beacon_key = self.all_beacon_keys[0]
             else:
                 beacon_key = "test-key"
-            encryptors[ENCRYPTION_V2_DEFAULT_KEY] = SingleTenantEncryptor(
-                encrypting_materials_manager=None,
-                decrypting_materials_manager=configure_materials_manager(
+            encryptors[ENCRYPTION_V2_DEFAULT_KEY] = LazySingleTenantEncryptor(
+                encrypting_materials_manager_factory=None,
+                decrypting_materials_manager_factory=partial(
+                    self._make_decrypting_materials_manager,
                     graph,
-                    key_provider=configure_decrypting_key_provider(
-                        graph,
-                        self.all_account_ids,  # Use all accumulated account_ids
-                        "aws",  # Assuming the partition is always "aws"
-                        self.all_key_ids,  # Use all accumulated key_ids
-                    ),
+                    self.all_account_ids,  # Use all accumulated account_ids
+                    "aws",  # Assuming the partition is always "aws"
+                    self.all_key_ids,  # Use all accumulated key_ids
                 ),
                 beacon_key=beacon_key,
             )
@@ -142,3 +153,24 @@ class MultiTenantKeyRegistry:
         return MultiTenantEncryptor(
             encryptors=encryptors,
         )
+
+    def _make_encrypting_materials_manager(self, graph, context_data):
+        return configure_materials_manager(
+            graph,
+            key_provider=configure_encrypting_key_provider(
+                graph,
+                key_ids=context_data["key_ids"],
+                restricted=context_data["restricted"],
+            ),
+        )
+
+    def _make_decrypting_materials_manager(self, graph, account_ids, partition, key_ids):
+        return configure_materials_manager(
+            graph,
+            key_provider=configure_decrypting_key_provider(
+                graph,
+                account_ids,
+                partition,
+                key_ids,
+            ),
+        )
@@ -1,3 +1,5 @@
+from operator import attrgetter
+from sys import intern
 from typing import (
     Any,
     Callable,
@@ -8,7 +10,7 @@ from typing import (
     overload,
 )
 
-from sqlalchemy import ColumnElement, LargeBinary, String
+from sqlalchemy import ClauseElement, ColumnElement, LargeBinary, String
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.orm import InstrumentedAttribute, Mapped, mapped_column
@@ -18,7 +20,7 @@ from microcosm_postgres.encryption.v2.beacons import BeaconHashAlgorithm
 from microcosm_postgres.encryption.v2.errors import DecryptionError
 
 from .encoders import Encoder
-from .encryptors import Encryptor
+from .encryptors import AwsKmsEncryptor, Encryptor
 
 
 T = TypeVar("T")
@@ -27,13 +29,21 @@ T = TypeVar("T")
 NOT_SET = object()
 
 
+def _is_expression(value: Any) -> bool:
+    """
+    Whether a value is a SQL expression (e.g. a column, attribute or subquery) rather than a literal.
+
+    """
+    return isinstance(value, ClauseElement) or hasattr(value, "__clause_element__")
+
+
 class BeaconComparator(Comparator):
     def __init__(
         self,
         val,
         encoder_fn: Callable,
         beacon_fn: Callable,
-        encrypt_fn: Callable[[str], bytes | None],
+        should_encrypt_fn: Callable[[], bool] | None,
         beacon_val: Any = None,
         beacon_algorithm: BeaconHashAlgorithm | None = None,
     ):
@@ -45,7 +55,7 @@ class BeaconComparator(Comparator):
 
         self.encoder_fn = encoder_fn
         self.beacon_fn = beacon_fn
-        self.encrypt_fn = encrypt_fn
+        self.should_encrypt_fn = should_encrypt_fn
         self.beacon_algorithm = beacon_algorithm
 
     def operate(self, op: Callable, other: Any = NOT_SET, **kwargs: Any) -> ColumnElement[Any]:  # type: ignore[override]  # noqa: E501
@@ -60,8 +70,13 @@ class BeaconComparator(Comparator):
             # e.g in_([1,2,3])
             # So we beaconise each of the values in the list
             # e.g [1,2,3] -> [beacon(1), beacon(2), beacon(3)]
+            #
+            # SQL expressions (e.g. a subquery) are not values and are never beaconised
+            if _is_expression(other):
+                return op(self.__clause_element__(), other, **kwargs)
+
             if self._check_if_should_use_beacon():
-                return op(self.beacon_val, self._beaconise(other, use_array=isinstance(other, list)), **kwargs)
+                return op(self.beacon_val, self._beaconise(other, use_array=isinstance(other, (list, tuple))), **kwargs)
             else:
                 return op(self.val, other, **kwargs)
         return op(self.val, other, **kwargs)
@@ -79,25 +94,39 @@ class BeaconComparator(Comparator):
         if not self._check_if_should_use_beacon():
             return self.val == other
 
-        return self.__clause_element__() == self._beaconise(other)
+        # Comparing against another column or hybrid: compare the beacons directly
+        if _is_expression(other):
+            return self.beacon_val == other
+
+        return self.beacon_val == self._beaconise(other)
 
     def _beaconise(self, value: Any, use_array: bool = False) -> Any:
         if use_array:
-            return [self._beaconise(v) for v in value]
+            # Beaconise the whole sequence in one call to the encryptor
+            beaconised_values = self.beacon_fn(
+                [self.encoder_fn(v) for v in value],
+                use_array=True,
+                algorithm=self.beacon_algorithm,
+            )
+            # Arrays drop values without a beacon; as for single values, a query must not
+            if len(beaconised_values) < len(value):
+                raise AwsKmsEncryptor.BeaconKeyNotSet()
+            return beaconised_values
 
         encoded = self.encoder_fn(value)
         beaconised = self.beacon_fn(encoded, algorithm=self.beacon_algorithm)
         return beaconised
 
     def _check_if_should_use_beacon(self):
-        # If the encrypt_fn returns `None` we know not use the beacon
+        # If the encryptor is not encrypting we know not use the beacon
         # and just use the normal flow (without beacons)
-        if self.encrypt_fn is None:
+        #
+        # NB: comparators may outlive the current encryptor context (e.g. when stored
+        # in a store's auto filters), so this must be evaluated on each use
+        if self.should_encrypt_fn is None:
             return False
 
-        test_val_to_encrypt = "test"
-        encrypted_val = self.encrypt_fn(test_val_to_encrypt)
-        return encrypted_val is not None
+        return self.should_encrypt_fn()
 
     key = 'beacon'
 
@@ -153,6 +182,8 @@ class encryption(hybrid_property[T], Generic[T]):
         beacon_algorithm: BeaconHashAlgorithm | None = None,
     ):
         self.default = default
+        # Resolve constant defaults into a factory once, rather than on every insert
+        self._default_fn: Callable[[], T] = default if callable(default) else lambda: default
         self.key = key
         self.encryptor = encryptor
         self.encoder = encoder
@@ -163,9 +194,14 @@ class encryption(hybrid_property[T], Generic[T]):
         # This is used in the store auto filters
         self.name = key
 
-        beacon_field = f"{key}_beacon"
-        encrypted_field = f"{key}_encrypted"
-        unencrypted_field = f"{key}_unencrypted"
+        # Interned, as these are used as attribute and instance dict keys on every access
+        beacon_field = intern(f"{key}_beacon")
+        encrypted_field = intern(f"{key}_encrypted")
+        unencrypted_field = intern(f"{key}_unencrypted")
+
+        # Precompiled accessors for the instrumented attributes (on both instances and classes)
+        get_encrypted = attrgetter(encrypted_field)
+        get_unencrypted = attrgetter(unencrypted_field)
 
         # Shortcuts to the relevant functions used throughout the hybrid
         encrypt_fn = encryptor.encrypt
@@ -175,16 +211,43 @@ class encryption(hybrid_property[T], Generic[T]):
         decoder_fn = encoder.decode
 
         def _prop(self):
-            encrypted = getattr(self, encrypted_field)
+            # Read loaded values straight from the instance dict, falling back to the
+            # instrumented attribute for anything that is expired or not yet loaded
+            instance_dict = self.__dict__
+            encrypted = instance_dict.get(encrypted_field, NOT_SET)
+            if encrypted is NOT_SET:
+                encrypted = get_encrypted(self)
 
             if encrypted is None:
-                return getattr(self, unencrypted_field)
+                unencrypted = instance_dict.get(unencrypted_field, NOT_SET)
+                if unencrypted is NOT_SET:
+                    return get_unencrypted(self)
+                return unencrypted
             try:
                 return decoder_fn(decrypt_fn(encrypted))
             except DecryptionError:
                 return encoder.redacted_value
 
+        # The instrumented attributes' setters for each model class using this hybrid,
+        # resolved on first write so each assignment is a direct descriptor call
+        setters_by_class: dict[type, tuple[Callable, Callable, Callable | None]] = {}
+
+        def _resolve_setters(model: type) -> tuple[Callable, Callable, Callable | None]:
+            beacon = getattr(model, beacon_field, None)
+            setters = setters_by_class[model] = (
+                getattr(model, encrypted_field).__set__,
+                getattr(model, unencrypted_field).__set__,
+                beacon.__set__ if beacon is not None else None,
+            )
+            return setters
+
         def _prop_setter(self, value) -> None:
+            model = type(self)
+            setters = setters_by_class.get(model)
+            if setters is None:
+                setters = _resolve_setters(model)
+            set_encrypted, set_unencrypted, set_beacon = setters
+
             # We ignore the type - should come back as a string
             # as we don't explicitly say use_array=True inside the encoder
             # Typing needs to be updated in all encoder functions to support
@@ -192,19 +255,18 @@ class encryption(hybrid_property[T], Generic[T]):
             encoded = encoder_fn(value)  # type: ignore[arg-type]
             encrypted = encrypt_fn(encoded)  # type: ignore[arg-type]
             if encrypted is None:
-                setattr(self, unencrypted_field, value)
-                setattr(self, encrypted_field, None)
-                if hasattr(self, beacon_field):
-                    setattr(self, beacon_field, None)
+                set_unencrypted(self, value)
+                set_encrypted(self, None)
+                if set_beacon is not None:
+                    set_beacon(self, None)
                 return
 
-            setattr(self, encrypted_field, encrypted)
-            setattr(self, unencrypted_field, None)
-            if hasattr(self, beacon_field):
+            set_encrypted(self, encrypted)
+            set_unencrypted(self, None)
+            if set_beacon is not None:
                 keep_as_array = isinstance(value, list)
-                setattr(
+                set_beacon(
                     self,
-                    beacon_field,
                     beacon_fn(  # type: ignore[call-overload]
                         encoder_fn(
                             value, keep_as_array=keep_as_array
@@ -217,15 +279,15 @@ class encryption(hybrid_property[T], Generic[T]):
         def _prop_comparator(cls) -> Comparator[T] | InstrumentedAttribute:
             if beacon := getattr(cls, beacon_field, None):
                 return BeaconComparator(
-                    val=getattr(cls, unencrypted_field),
+                    val=get_unencrypted(cls),
                     beacon_val=beacon,
                     encoder_fn=encoder_fn,
                     beacon_fn=beacon_fn,
-                    encrypt_fn=encrypt_fn,
+                    should_encrypt_fn=encryptor.should_encrypt,
                     beacon_algorithm=beacon_algorithm,
                 )
 
-            return getattr(cls, unencrypted_field)
+            return get_unencrypted(cls)
 
         super().__init__(
             _prop,
@@ -242,21 +304,21 @@ class encryption(hybrid_property[T], Generic[T]):
         if self.default is NOT_SET:
             return mapped_column(self.key + "_encrypted", LargeBinary, nullable=True, info=cast(dict, info))
 
+        should_encrypt_fn = self.encryptor.should_encrypt
+        encrypt_fn = self.encryptor.encrypt
+        encoder_fn = self.encoder.encode
+        default_fn = self._default_fn
+
+        def _encrypted_default() -> bytes | None:
+            if not should_encrypt_fn():
+                return None
+            return encrypt_fn(cast(str, encoder_fn(default_fn())))
+
         return mapped_column(
             self.key + "_encrypted",
             LargeBinary,
             nullable=True,
-            default=(
-                lambda: (
-                    self.encryptor.encrypt(
-                        cast(str, self.encoder.encode(
-                            self.default() if callable(self.default) else self.default
-                        ))
-                    )
-                    if self.encryptor.should_encrypt()
-                    else None
-                )
-            ),
+            default=_encrypted_default,
             info=cast(dict, info),
         )
 
@@ -272,15 +334,19 @@ class encryption(hybrid_property[T], Generic[T]):
         if self.default is NOT_SET:
             return mapped_column(self.key, self.column_type, nullable=True, info=info, **kwargs)
 
+        should_encrypt_fn = self.encryptor.should_encrypt
+        default_fn = self._default_fn
+
+        def _unencrypted_default() -> T | None:
+            if should_encrypt_fn():
+                return None
+            return default_fn()
+
         return mapped_column(
             self.key,
             self.column_type,
             nullable=True,
-            default=lambda: (
-                None
-                if self.encryptor.should_encrypt()
-                else (self.default() if callable(self.default) else self.default)
-            ),
+            default=_unencrypted_default,
             info=info,
             **kwargs,
         )
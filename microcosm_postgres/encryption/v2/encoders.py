@@ -17,6 +17,12 @@ from typing import (
 import sqlalchemy
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
+from microcosm_postgres.serialization import json_loads
+
+
+# The JSON encoding of None, as written for null values by the Nullable encoder
+NULL_JSON = json.dumps(None)
+
 
 T = TypeVar("T")
 JSONType: TypeAlias = (
@@ -166,7 +172,7 @@ class ArrayEncoder(Encoder[list[T]], Generic[T]):
 
     @decode_exception_wrapper
     def decode(self, value: str, **kwargs) -> list[T]:
-        return [self.element_encoder.decode(v) for v in json.loads(value)]
+        return [self.element_encoder.decode(v) for v in json_loads(value)]
 
 
 class JSONEncoder(Encoder[JSONType]):
@@ -179,7 +185,7 @@ class JSONEncoder(Encoder[JSONType]):
 
     @decode_exception_wrapper
     def decode(self, value: str, **kwargs) -> JSONType:
-        return json.loads(value)
+        return json_loads(value)
 
 
 class Nullable(Encoder[T | None], Generic[T]):
@@ -195,7 +201,7 @@ class Nullable(Encoder[T | None], Generic[T]):
         self, value: T | None, keep_as_array: bool = False, **kwargs
     ) -> str | list[str]:
         if value is None:
-            return json.dumps(value)
+            return NULL_JSON
 
         if keep_as_array:
             return self.inner_encoder.encode(value, keep_as_array=keep_as_array)
@@ -204,7 +210,7 @@ class Nullable(Encoder[T | None], Generic[T]):
 
     @decode_exception_wrapper
     def decode(self, value: str, **kwargs) -> T | None:
-        if (loaded_value := json.loads(value)) is None:
+        if value == NULL_JSON or (loaded_value := json_loads(value)) is None:
             return None
 
         return self.inner_encoder.decode(loaded_value)
@@ -223,6 +229,8 @@ class EnumEncoder(Encoder[E], Generic[E]):
 
     def __init__(self, enum: type[E]):
         self._enum = enum
+        # Read-only view of the name to member map, to skip Enum.__getitem__ on decode
+        self._members = enum.__members__
         self.redacted_value = list(self._enum)[0]
 
     @encode_exception_wrapper
@@ -231,4 +239,4 @@ class EnumEncoder(Encoder[E], Generic[E]):
 
     @decode_exception_wrapper
     def decode(self, value: str, **kwargs) -> E:
-        return self._enum[value]
+        return self._members[value]
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from contextlib import contextmanager, nullcontext
-from contextvars import ContextVar
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
 from typing import (
     Any,
     ContextManager,
-    Iterator,
     Literal,
     Protocol,
     TypeAlias,
@@ -79,6 +78,38 @@ class PlainTextEncryptor(Encryptor, Protocol):
 EncryptorContext: TypeAlias = "tuple[str, SingleTenantEncryptor] | None"
 
 
+def _get_header(opaque: dict[str, Any], name: str) -> Any:
+    """
+    Case-insensitive lookup of a (lower-cased) header name, without copying the opaque data.
+
+    As with normalising the keys, the last matching key wins.
+
+    """
+    value = None
+    for key, key_value in opaque.items():
+        if key.lower() == name:
+            value = key_value
+    return value
+
+
+class _EncryptorScope:
+    """
+    Resets an encryptor context variable to its previous value on exit.
+
+    """
+    __slots__ = ("_context_var", "_token")
+
+    def __init__(self, context_var: ContextVar[EncryptorContext], token: Token[EncryptorContext]) -> None:
+        self._context_var = context_var
+        self._token = token
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: Any) -> None:
+        self._context_var.reset(self._token)
+
+
 class AwsKmsEncryptor(Encryptor):
     _encryptor_context: ContextVar[EncryptorContext] = ContextVar("_encryptor_context")
 
@@ -114,65 +145,76 @@ class AwsKmsEncryptor(Encryptor):
                     ...
             ```
         """
-        token = cls._encryptor_context.set((context, encryptor))
-
-        @contextmanager
-        def _token_wrapper() -> Iterator[None]:
-            try:
-                yield
-            finally:
-                cls._encryptor_context.reset(token)
-
-        return _token_wrapper()
+        return _EncryptorScope(cls._encryptor_context, cls._encryptor_context.set((context, encryptor)))
 
     @classmethod
-    def set_context_from_graph(cls, graph: ObjectGraph) -> ContextManager[None]:
-        encryptors: MultiTenantEncryptor = graph.multi_tenant_encryptor
+    def context_from_graph(cls, graph: ObjectGraph) -> EncryptorContext:
+        """
+        Resolve the encryptor context for the current request, if any.
 
-        def normalise(opaque: dict[str, Any]) -> dict[str, Any]:
-            return {k.lower(): v for k, v in opaque.items()}
+        """
+        encryptors: MultiTenantEncryptor = graph.multi_tenant_encryptor
 
-        client_id = normalise(graph.request_context()).get(X_REQUEST_CLIENT_HEADER)
+        client_id = _get_header(graph.request_context(), X_REQUEST_CLIENT_HEADER)
         if client_id is None or client_id not in encryptors.encryptors:
             # Then we return back the default encryptor
             default_encryptor = encryptors[ENCRYPTION_V2_DEFAULT_KEY]
             if default_encryptor is None:
-                return nullcontext()
-            return cls.set_encryptor_context(
-                ENCRYPTION_V2_DEFAULT_KEY, default_encryptor
-            )
+                return None
+            return ENCRYPTION_V2_DEFAULT_KEY, default_encryptor
 
         client_encryptor = encryptors[client_id]
         if client_encryptor is None:
+            return None
+        return client_id, client_encryptor
+
+    @classmethod
+    def set_context_from_graph(cls, graph: ObjectGraph) -> ContextManager[None]:
+        encryptor_context = cls.context_from_graph(graph)
+        if encryptor_context is None:
             return nullcontext()
-        return cls.set_encryptor_context(client_id, client_encryptor)
+        return cls.set_encryptor_context(*encryptor_context)
 
     @classmethod
     def register_flask_context(cls, graph: ObjectGraph) -> None:
+        from flask import g
+
         graph.use("multi_tenant_encryptor")
 
         @graph.flask.before_request
         def _register_encryptor():
-            cls.set_context_from_graph(graph)
-
-        @graph.flask.after_request
-        def _reset_encryptor(response):
-            cls._encryptor_context.set(None)
-            return response
+            # Keep the token so that teardown restores the previous context,
+            # even when the request fails before after_request handlers run
+            g.encryptor_context_token = cls._encryptor_context.set(cls.context_from_graph(graph))
+
+        @graph.flask.teardown_request
+        def _reset_encryptor(exception=None):
+            token = g.pop("encryptor_context_token", None)
+            if token is None:
+                return
+            try:
+                cls._encryptor_context.reset(token)
+            except ValueError:
+                # The token was created in a different context
+                cls._encryptor_context.set(None)
 
     def should_encrypt(self) -> bool:
-        if self.encryptor_context is None:
+        encryptor_context = self._encryptor_context.get(None)
+        if encryptor_context is None:
             return False
 
-        _, encryptor = self.encryptor_context
+        _, encryptor = encryptor_context
         return encryptor.encrypting_materials_manager is not None
 
     def encrypt(self, value: str) -> bytes | None:
-        if not self.should_encrypt():
+        # NB: read the context variable once per call
+        encryptor_context = self._encryptor_context.get(None)
+        if encryptor_context is None:
             return None
 
-        assert self.encryptor_context is not None
-        context, encryptor = self.encryptor_context
+        context, encryptor = encryptor_context
+        if encryptor.encrypting_materials_manager is None:
+            return None
 
         # Note that the encryptor may return back None
         encrypted = encryptor.encrypt(context, value)
@@ -182,15 +224,53 @@ class AwsKmsEncryptor(Encryptor):
             return encrypted[0]
 
     def decrypt(self, value: bytes) -> str | None:
-        if self.encryptor_context is None:
+        encryptor_context = self._encryptor_context.get(None)
+        if encryptor_context is None:
             raise self.EncryptorNotBound("Decryption context is not set")
 
-        context, encryptor = self.encryptor_context
+        context, encryptor = encryptor_context
         try:
             return encryptor.decrypt(context, value)
         except DecryptKeyError as e:
             raise DecryptionError() from e
 
+    def encrypt_many(self, values: list[str]) -> list[bytes | None]:
+        """
+        Encrypt many values with the encryptor bound to the current context.
+
+        The context is resolved once for the whole batch.
+
+        """
+        encryptor_context = self._encryptor_context.get(None)
+        if encryptor_context is None:
+            return [None] * len(values)
+
+        context, encryptor = encryptor_context
+        if encryptor.encrypting_materials_manager is None:
+            return [None] * len(values)
+
+        return [
+            None if encrypted is None else encrypted[0]
+            for encrypted in (encryptor.encrypt(context, value) for value in values)
+        ]
+
+    def decrypt_many(self, values: list[bytes]) -> list[str | None]:
+        """
+        Decrypt many values with the encryptor bound to the current context.
+
+        The context is resolved once for the whole batch.
+
+        """
+        encryptor_context = self._encryptor_context.get(None)
+        if encryptor_context is None:
+            raise self.EncryptorNotBound("Decryption context is not set")
+
+        context, encryptor = encryptor_context
+        try:
+            return list(encryptor.decrypt_many(context, values))
+        except DecryptKeyError as e:
+            raise DecryptionError() from e
+
     @overload
     def beacon(
         self,
@@ -215,13 +295,14 @@ class AwsKmsEncryptor(Encryptor):
         use_array: bool = False,
         algorithm: BeaconHashAlgorithm | None = None,
     ) -> list[str] | str:
-        if self.encryptor_context is None:
+        encryptor_context = self._encryptor_context.get(None)
+        if encryptor_context is None:
             raise self.EncryptorNotBound()
 
-        _, encryptor = self.encryptor_context
+        _, encryptor = encryptor_context
         if use_array:
             assert isinstance(value, list)
-            _beacon = [encryptor.beacon(v, algorithm=algorithm) for v in value]
+            _beacon = encryptor.beacon_many(value, algorithm=algorithm)
             # Filter out the None values
             _beacon = [v for v in _beacon if v is not None]
 
@@ -1,4 +1,5 @@
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterator, Protocol
 
 from microcosm.object_graph import ObjectGraph
@@ -8,12 +9,17 @@ from sqlalchemy.orm import Session
 from microcosm_postgres.context import SessionContext, transaction
 from microcosm_postgres.encryption.v2.column import encryption as encryption_column
 from microcosm_postgres.encryption.v2.contexts import encryptor_session_context_as_client
+from microcosm_postgres.encryption.v2.encryptors import AwsKmsEncryptor
 from microcosm_postgres.encryption.v2.reencryption.stats import (
     ReencryptionStatistic,
     ReencryptionStatsCollector,
 )
 from microcosm_postgres.encryption.v2.reencryption.utils import elapsed_time, reencrypt_instance
 from microcosm_postgres.models import Model
+from microcosm_postgres.operations import new_session
+
+
+DEFAULT_BATCH_SIZE = 100
 
 
 class InstanceIterator(Protocol):
@@ -43,6 +49,11 @@ class ReencryptionCli:
         # Squash into single list of models
         self.all_models = [item for sublist in base_models_mapping.values() for item in sublist]
 
+        # Models using encryption by base model, shared by the audit and the reencryption validations
+        self._models_using_encryption: dict[type, list[type]] = {}
+        # Encryption column names by model, as inspected once per class
+        self._encryption_columns: dict[type, list[str]] = {}
+
         self.parser = ArgumentParser(description="Reencryption CLI")
         self.subparsers = self.parser.add_subparsers()
 
@@ -63,33 +74,109 @@ class ReencryptionCli:
 
     def reencrypt(self, args: Any):
         client_id, dry_run = self._get_reencrypt_args(args)
+        workers = getattr(args, "workers", 1) or 1
+        batch_size = getattr(args, "batch_size", DEFAULT_BATCH_SIZE) or DEFAULT_BATCH_SIZE
         self._run_validations(client_id)
 
         elapsed_time_data: dict[str, Any] = dict()
-        with (
-            elapsed_time(elapsed_time_data),
-            encryptor_session_context_as_client(self.graph, client_id=client_id),
-            transaction(),
-        ):
-            session = SessionContext.session
-            stats: list[ReencryptionStatistic] = []
-
-            # We assume that we have one iterator per model type
-            collector = ReencryptionStatsCollector()
-            for instance_iterator in self.iterators:
-                for instance in instance_iterator(session=session, client_id=client_id, graph=self.graph):
-                    found_to_be_unencrypted, changed_committed = reencrypt_instance(
-                        session=session,
-                        instance=instance,
-                        encryption_columns=self._get_encryption_columns(instance),
-                        dry_run=dry_run,
-                    )
-                    model = self._find_model_for_instance(instance)
-                    collector.update(found_to_be_unencrypted, changed_committed, model_name=model.__name__)
+        with elapsed_time(elapsed_time_data):
+            if workers > 1:
+                collector = self._reencrypt_in_parallel(client_id, dry_run, workers, batch_size)
+            else:
+                collector = ReencryptionStatsCollector()
+                with (
+                    encryptor_session_context_as_client(self.graph, client_id=client_id),
+                    transaction(),
+                ):
+                    # We assume that we have one iterator per model type
+                    for instance_iterator in self.iterators:
+                        self._reencrypt_instances(
+                            SessionContext.session, instance_iterator, client_id, dry_run, batch_size, collector,
+                        )
 
         stats = collector.get_stats()
         self._write_reenrypt_logs(elapsed_time_data, stats)
 
+    def _reencrypt_in_parallel(
+        self,
+        client_id: str,
+        dry_run: bool,
+        workers: int,
+        batch_size: int,
+    ) -> ReencryptionStatsCollector:
+        """
+        Run each instance iterator on its own thread, with its own session and encryptor context.
+
+        Iterators must use the session they are passed, rather than `SessionContext.session`.
+
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            collectors = list(executor.map(
+                lambda instance_iterator: self._reencrypt_with_new_session(
+                    instance_iterator, client_id, dry_run, batch_size,
+                ),
+                self.iterators,
+            ))
+
+        collector = ReencryptionStatsCollector()
+        for worker_collector in collectors:
+            collector.merge(worker_collector)
+        return collector
+
+    def _reencrypt_with_new_session(
+        self,
+        instance_iterator: InstanceIterator,
+        client_id: str,
+        dry_run: bool,
+        batch_size: int,
+    ) -> ReencryptionStatsCollector:
+        collector = ReencryptionStatsCollector()
+        encryptor = self.graph.multi_tenant_encryptor[client_id]
+        session = new_session(self.graph)
+        try:
+            with AwsKmsEncryptor.set_encryptor_context(client_id, encryptor):
+                self._reencrypt_instances(session, instance_iterator, client_id, dry_run, batch_size, collector)
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        return collector
+
+    def _reencrypt_instances(
+        self,
+        session: Session,
+        instance_iterator: InstanceIterator,
+        client_id: str,
+        dry_run: bool,
+        batch_size: int,
+        collector: ReencryptionStatsCollector,
+    ) -> None:
+        """
+        Reencrypt the instances from one iterator, committing every `batch_size` changed instances.
+
+        Any remaining changes are committed by the caller.
+
+        """
+        pending = 0
+        for instance in instance_iterator(session=session, client_id=client_id, graph=self.graph):
+            found_to_be_unencrypted, changed = reencrypt_instance(
+                session=session,
+                instance=instance,
+                encryption_columns=self._get_encryption_columns(instance),
+                dry_run=dry_run,
+            )
+            model = self._find_model_for_instance(instance)
+            collector.update(found_to_be_unencrypted, changed, model_name=model.__name__)
+
+            if changed:
+                pending += 1
+                if pending >= batch_size:
+                    session.commit()
+                    pending = 0
+
     def audit(self, args: Any):
         for base_model in self.base_models_mapping:
             models = self._find_models_using_encryption(base_model=base_model)
@@ -138,12 +225,12 @@ class ReencryptionCli:
 
     def _verify_planning_to_handle_all_tables(self, base_model: type, models_to_encrypt: list[type]):
         models_with_encryption = self._find_models_using_encryption(base_model)
-        expected_models = set(m.__name__ for m in models_with_encryption)
-        actual_models = set(m.__name__ for m in models_to_encrypt)
 
-        diff = expected_models.difference(actual_models)
+        # Compare the model classes themselves (same-named models may live in different modules)
+        diff = set(models_with_encryption).difference(models_to_encrypt)
         if diff:
-            raise ValueError(f"Looks like we might be missing a table(s) using encryption: {', '.join(diff)}")
+            missing = ", ".join(sorted(m.__name__ for m in diff))
+            raise ValueError(f"Looks like we might be missing a table(s) using encryption: {missing}")
 
     def _write_reenrypt_logs(self, elapsed_time_data: dict[str, Any], stats: list[ReencryptionStatistic]):
         print("Success!")  # noqa: T201
@@ -159,6 +246,12 @@ class ReencryptionCli:
         else:
             model = instance.__class__
 
+        encryption_columns = self._encryption_columns.get(model)
+        if encryption_columns is None:
+            encryption_columns = self._encryption_columns[model] = self._inspect_encryption_columns(model)
+        return encryption_columns
+
+    def _inspect_encryption_columns(self, model: type) -> list[str]:
         try:
             inspected_model: Any = inspect(model)
         except Exception:
@@ -194,6 +287,20 @@ class ReencryptionCli:
             help="Execute the command without making actual changes. Default is True."
         )
 
+        reencrypt_command_parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Number of reencrypted instances to commit at a time. Default is {DEFAULT_BATCH_SIZE}.",
+        )
+
+        reencrypt_command_parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of instance iterators to run concurrently, each with its own session. Default is 1.",
+        )
+
         reencrypt_command_parser.set_defaults(func=fn)
 
     def _add_audit_command(self, fn):
@@ -206,6 +313,10 @@ class ReencryptionCli:
 
         Uses the microcosm-postgres base model, and looks for v2 encryption approach by default.
         """
+        encryption_models = self._models_using_encryption.get(base_model)
+        if encryption_models is not None:
+            return encryption_models
+
         models = base_model.__subclasses__()
 
         encryption_models = []
@@ -214,6 +325,7 @@ class ReencryptionCli:
             if len(cols) > 0:
                 encryption_models.append(model)
 
+        self._models_using_encryption[base_model] = encryption_models
         return encryption_models
 
     def _log_reencryption_usage_info(self, models_with_encryption: list[type]) -> None:
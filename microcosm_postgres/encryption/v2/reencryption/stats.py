@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ReencryptionStatistic:
     """
     Class usage to track reencryption statistics
@@ -26,6 +26,14 @@ class ReencryptionStatsCollector:
     Designed to be used with the reencryption cli
 
     """
+    __slots__ = (
+        "instances_found_to_be_unencrypted",
+        "instances_reencrypted",
+        "total_instances_found",
+        "model",
+        "data",
+    )
+
     def __init__(self):
         self.instances_found_to_be_unencrypted = 0
         self.instances_reencrypted = 0
@@ -35,7 +43,7 @@ class ReencryptionStatsCollector:
         # Data holds a mapping of model_name to ReencryptionStatistic
         self.data = dict()
 
-    def update(self, found_to_be_unencrypted, changed_committed, model_name: str):
+    def update(self, found_to_be_unencrypted: bool, changed_committed: bool, model_name: str):
         statistic = self.data.get(model_name)
         if statistic is None:
             statistic = ReencryptionStatistic(
@@ -46,9 +54,21 @@ class ReencryptionStatsCollector:
             )
             self.data[model_name] = statistic
 
-        statistic.instances_found_to_be_unencrypted += 1 if found_to_be_unencrypted else 0
-        statistic.instances_reencrypted += 1 if changed_committed else 0
+        # bools count as 0 or 1
+        statistic.instances_found_to_be_unencrypted += found_to_be_unencrypted
+        statistic.instances_reencrypted += changed_committed
         statistic.total_instances_found += 1
 
+    def merge(self, other: "ReencryptionStatsCollector") -> None:
+        for model_name, other_statistic in other.data.items():
+            statistic = self.data.get(model_name)
+            if statistic is None:
+                self.data[model_name] = other_statistic
+                continue
+
+            statistic.instances_found_to_be_unencrypted += other_statistic.instances_found_to_be_unencrypted
+            statistic.instances_reencrypted += other_statistic.instances_reencrypted
+            statistic.total_instances_found += other_statistic.total_instances_found
+
     def get_stats(self) -> list[ReencryptionStatistic]:
         return list(self.data.values())
@@ -1,10 +1,21 @@
 from contextlib import contextmanager
+from functools import lru_cache
+from sys import intern
 from time import time
 from typing import Any, Iterator
 
 from sqlalchemy.orm import Session
 
 
+@lru_cache(maxsize=None)
+def unencrypted_attribute(column_name: str) -> str:
+    """
+    The name of the unencrypted attribute backing an encryption column, built once per column.
+
+    """
+    return intern(f"{column_name}_unencrypted")
+
+
 def reencrypt_instance(
     session: Session, instance: Any, encryption_columns: list[str], dry_run: bool = False
 ) -> tuple[bool, bool]:
@@ -12,26 +23,34 @@ def reencrypt_instance(
     Update the instance in a way in which the ORM is leveraged, so that writes leveraging
     encryption are used.
 
-    We return back a tuple of (found_to_be_unencrypted, change_commited)
+    Changes are merged into the session but not committed; the caller controls commit boundaries.
+
+    We return back a tuple of (found_to_be_unencrypted, changed)
     - found_to_be_unencrypted: True if any of the columns of the instance are unencrypted
-    - change_commited: True if the instance was changed and committed to the database
+    - changed: True if the instance was changed (and needs to be committed)
     """
     found_to_be_unencrypted = False
-    change_commited = False
+    changed = False
     for column_name in encryption_columns:
         # Check if the column is unencrypted
-        if getattr(instance, f"{column_name}_unencrypted") is not None:
+        if not found_to_be_unencrypted and getattr(instance, unencrypted_attribute(column_name)) is not None:
             found_to_be_unencrypted = True
+            if dry_run:
+                # Nothing else to learn about this instance
+                break
 
         if not dry_run:
             # Make the encryption attributes dirty by setting their values.
             # ie. instance.my_column = instance.my_column
             setattr(instance, column_name, getattr(instance, column_name))
-            session.merge(instance)
-            session.commit()
-            change_commited = True
+            changed = True
+
+    if changed and instance not in session:
+        # Instances from the session's own iterator are already tracked; only
+        # detached instances need merging (which may reload them first)
+        session.merge(instance)
 
-    return found_to_be_unencrypted, change_commited
+    return found_to_be_unencrypted, changed
 
 
 @contextmanager
@@ -8,6 +8,9 @@ from microcosm.api import binding, defaults
 from microcosm.config.types import boolean
 from microcosm.config.validation import typed
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL
+
+from microcosm_postgres.serialization import json_loads, orjson
 
 
 def choose_database_name(metadata, config):
@@ -49,17 +52,30 @@ def choose_username(metadata, config):
     return metadata.name
 
 
+def choose_url(metadata, config):
+    """
+    Choose the database URL to use.
+
+    Building the URL from its parts (rather than parsing a formatted string) escapes
+    any special characters in the username or password.
+
+    """
+    return URL.create(
+        drivername=config.driver,
+        username=choose_username(metadata, config),
+        password=config.password,
+        host=config.host,
+        port=config.port,
+        database=choose_database_name(metadata, config),
+    )
+
+
 def choose_uri(metadata, config):
     """
     Choose the database URI to use.
 
     """
-    database_name = choose_database_name(metadata, config)
-    driver = config.driver
-    host, port = config.host, config.port
-    username, password = choose_username(metadata, config), config.password
-
-    return f"{driver}://{username}:{password}@{host}:{port}/{database_name}"
+    return choose_url(metadata, config).render_as_string(hide_password=False)
 
 
 def choose_connect_args(metadata, config):
@@ -91,8 +107,13 @@ def choose_args(metadata, config):
     Choose database connection arguments.
 
     """
-    return dict(
-        connect_args=choose_connect_args(metadata, config),
+    connect_args = choose_connect_args(metadata, config)
+    if metadata.testing:
+        # test databases are disposable; don't wait for the WAL to reach disk on every commit
+        connect_args.update(options="-c synchronous_commit=off")
+
+    args = dict(
+        connect_args=connect_args,
         echo=config.echo,
         max_overflow=config.max_overflow,
         pool_size=config.pool_size,
@@ -101,6 +122,16 @@ def choose_args(metadata, config):
         pool_pre_ping=config.pool_pre_ping,
     )
 
+    if orjson is not None:
+        # psycopg2 parses JSON/JSONB results with this (rather than the standard library)
+        args.update(json_deserializer=json_loads)
+
+    if config.executemany_mode:
+        # psycopg2 only; e.g. "values_plus_batch" sends batched UPDATEs in fewer round trips
+        args.update(executemany_mode=config.executemany_mode)
+
+    return args
+
 
 def reconnecting_engine(engine, num_retries, retry_interval):
     def _run_with_retries(fn, context, cursor_obj, statement, *arg, **kw):
@@ -149,10 +180,10 @@ def reconnecting_engine(engine, num_retries, retry_interval):
 
 
 def make_engine(metadata, config):
-    uri = choose_uri(metadata, config.postgres)
+    url = choose_url(metadata, config.postgres)
     args = choose_args(metadata, config.postgres)
     engine = create_engine(
-        uri,
+        url,
         **args,
     )
     retries = 10
@@ -203,6 +234,8 @@ def make_engine(metadata, config):
     engine_retries=typed(int, default_value=10),
     # Engine retry interval in milliseconds
     engine_retry_interval=typed(int, default_value=100),
+    # psycopg2 executemany mode (e.g. "values_plus_batch"); uses the driver default if not supplied
+    executemany_mode=None,
 )
 def configure_engine(graph):
     return make_engine(graph.metadata, graph.config)
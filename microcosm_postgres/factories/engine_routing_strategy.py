@@ -52,13 +52,21 @@ class ModelEngineRoutingStrategy(EngineRoutingStrategy):
 
     def __init__(self, graph):
         self.graph = graph
+        # engines for models that name one; unnamed models follow the current scope and are not cached
+        self.binds = {}
 
     def get_bind(self, mapper, clause=None):
         if mapper and mapper.class_:
+            model = mapper.class_
+            bind = self.binds.get(model)
+            if bind is not None:
+                return bind
+
             try:
-                engine_name = getattr(mapper.class_, ModelEngineRoutingStrategy.KEY)
+                engine_name = getattr(model, ModelEngineRoutingStrategy.KEY)
                 with self.graph.postgres.scoped_to(engine_name):
-                    return unwrap(self.graph.postgres)
+                    bind = self.binds[model] = unwrap(self.graph.postgres)
+                    return bind
             except AttributeError:
                 pass
 
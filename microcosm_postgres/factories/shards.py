@@ -61,6 +61,8 @@ def load_shard_defaults(config: Configuration, metadata: Metadata) -> None:
         engine_retries=typed(int, default_value=10),
         # Engine retry interval in milliseconds
         engine_retry_interval=typed(int, default_value=100),
+        # psycopg2 executemany mode (e.g. "values_plus_batch"); uses the driver default if not supplied
+        executemany_mode=None,
     )
     for k, v in requirements.items():
         if k not in config:
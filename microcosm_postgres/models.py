@@ -14,7 +14,8 @@ from dateutil.tz import tzutc
 from pytz import utc
 from sqlalchemy import Column, Float, types
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy_utils import UUIDType
+
+from microcosm_postgres.types import UUIDType
 
 
 EPOCH = datetime(1970, 1, 1)
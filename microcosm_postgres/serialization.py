@@ -0,0 +1,30 @@
+"""
+JSON (de)serialization helpers.
+
+"""
+import json
+from typing import Any
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(value: str | bytes) -> Any:
+    """
+    Parse JSON, using orjson (when installed) for speed.
+
+    NB: only parsing is accelerated; values are still serialized with `json.dumps`, whose
+    exact output is stored (and, for encrypted columns, hashed into beacons).
+
+    """
+    if orjson is None:
+        return json.loads(value)
+
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # e.g. NaN or integers beyond 64 bits, which the standard library accepts
+        return json.loads(value)
@@ -111,6 +111,10 @@ class Store:
         :raises `NotFound` if there is no existing model
 
         """
+        if not criterion and identifier is not None and type(self)._query is Store._query:
+            # a plain primary key lookup can use the identity map and skip the round trip
+            return self._get(identifier)
+
         return self._retrieve(
             self.model_class.id == identifier,
             *criterion
@@ -267,6 +271,22 @@ class Store:
                 error,
             )
 
+    def _get(self, identifier):
+        """
+        Retrieve a model by primary key, from the session's identity map when possible.
+
+        :raises `ModelNotFoundError` if there is no such model.
+
+        """
+        instance = self.session.get(self.model_class, identifier)
+        if instance is None:
+            raise ModelNotFoundError(
+                "{} not found".format(
+                    self.model_class.__name__,
+                ),
+            )
+        return instance
+
     def _delete(self, *criterion, synchronize_session="evaluate"):
         """
         Delete a model by some criterion.
@@ -9,28 +9,45 @@ from sqlalchemy.dialects.postgresql import insert
 from microcosm_postgres.context import SessionContext
 
 
-def to_dict(item, columns):
-    column_values = [
-        (column, getattr(item, column.name))
+def column_plan(columns):
+    """
+    Resolve what `to_dict` needs to know about each column, once for many items.
+
+    """
+    return [
+        (
+            column.name,
+            column.info.get("encryption_v2_key"),
+            column.info.get("encryption_v2_encrypted") is True,
+            bool(column.info.get("encryption_v2_unencrypted")),
+            bool(column.default),
+        )
         for column in columns
     ]
+
+
+def to_dict(item, columns, plan=None):
+    if plan is None:
+        plan = column_plan(columns)
+
+    column_values = [
+        (name, key, encrypted, unencrypted, has_default, getattr(item, name))
+        for name, key, encrypted, unencrypted, has_default in plan
+    ]
     encrypted_columns = {
-       column.info["encryption_v2_key"]
-       for column, value in column_values
-       if column.info.get("encryption_v2_encrypted") is True and value is not None
+       key
+       for _, key, encrypted, _, _, value in column_values
+       if encrypted and value is not None
     }
 
-    return dict(
-        (column.name, value)
-        for column, value in column_values
+    return {
+        name: value
+        for name, key, _, unencrypted, has_default, value in column_values
         # discard nulls if defaulted
-        if (value is not None or not column.default)
+        if (value is not None or not has_default)
         # discard unencrypted columns with encrypted counterparts
-        if not (
-            column.info.get("encryption_v2_unencrypted") and
-            column.info.get("encryption_v2_key") in encrypted_columns
-        )
-    )
+        if not (unencrypted and key in encrypted_columns)
+    }
 
 
 def insert_many(self, items):
@@ -38,12 +55,21 @@ def insert_many(self, items):
     Insert many items at once into a temporary table.
 
     """
-    return SessionContext.session.execute(
-        self.insert().values([
-            to_dict(item, self.c)
-            for item in items
-        ]),
-    ).rowcount
+    plan = column_plan(self.c)
+
+    # executemany needs the same keys in every parameter set; items that omit defaulted columns
+    # (or unencrypted counterparts) are grouped separately
+    parameters_by_keys = {}
+    for item in items:
+        parameters = to_dict(item, self.c, plan)
+        parameters_by_keys.setdefault(tuple(parameters), []).append(parameters)
+
+    # pass parameters separately so the compiled INSERT does not vary with the number of items
+    statement = self.insert()
+    return sum(
+        SessionContext.session.execute(statement, parameters).rowcount
+        for parameters in parameters_by_keys.values()
+    )
 
 
 def upsert_into(self, table):
@@ -58,28 +84,40 @@ def upsert_into(self, table):
     return self.upsert_into_on_conflict_do_nothing(table)
 
 
-def upsert_into_on_conflict_do_nothing(self, table):
+def upsert_into_on_conflict_do_nothing(self, table, returning=()):
     """
     Upsert from a temporarty table into another table.
 
+    Returns the row count or, if `returning` columns are given, the inserted rows' values for
+    those columns (saving a follow-up query).
+
     """
-    return SessionContext.session.execute(
+    return _execute_upsert(
         insert(table).from_select(
             self.c,
             self,
         ).on_conflict_do_nothing(),
-    ).rowcount
+        returning,
+    )
 
 
-def upsert_into_on_conflict_do_update(self, table, **on_conflict_kwargs):
-    return SessionContext.session.execute(
+def upsert_into_on_conflict_do_update(self, table, returning=(), **on_conflict_kwargs):
+    return _execute_upsert(
         insert(table).from_select(
             self.c,
             self,
         ).on_conflict_do_update(
             **on_conflict_kwargs,
         ),
-    ).rowcount
+        returning,
+    )
+
+
+def _execute_upsert(statement, returning):
+    if not returning:
+        return SessionContext.session.execute(statement).rowcount
+
+    return SessionContext.session.execute(statement.returning(*returning)).all()
 
 
 def select_from(self, table):
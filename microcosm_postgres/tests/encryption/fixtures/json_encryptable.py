@@ -1,4 +1,4 @@
-from json import dumps, loads
+from json import dumps
 from typing import Sequence, Tuple
 
 from microcosm.api import binding
@@ -14,6 +14,7 @@ from sqlalchemy_utils import JSONType, UUIDType
 from microcosm_postgres.encryption.models import EncryptableMixin, EncryptedMixin
 from microcosm_postgres.encryption.store import EncryptableStore
 from microcosm_postgres.models import EntityMixin, Model
+from microcosm_postgres.serialization import json_loads
 from microcosm_postgres.store import Store
 
 
@@ -69,7 +70,7 @@ class JsonEncryptable(EntityMixin, EncryptableMixin, Model):
 
     @classmethod
     def str_to_plaintext(cls, text: str) -> object:
-        return loads(text)
+        return json_loads(text)
 
 
 @binding("json_encrypted_store")
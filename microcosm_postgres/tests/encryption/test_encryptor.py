@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from hamcrest import (
     assert_that,
+    contains_exactly,
     contains_inanyorder,
     equal_to,
     is_,
@@ -11,6 +12,8 @@ from hamcrest import (
 from microcosm.api import create_object_graph, load_from_dict
 
 import microcosm_postgres.encryption.factories  # noqa: F401
+from microcosm_postgres.encryption.encryptor import MultiTenantEncryptor, SingleTenantEncryptor
+from microcosm_postgres.encryption.v2.beacons import BeaconHashAlgorithm
 
 
 try:
@@ -102,6 +105,36 @@ def test_cycle_multi_tenant():
     )
 
 
+def test_decrypt_many():
+    loader = load_from_dict(
+        multi_tenant_key_registry=dict(
+            context_keys=[
+                "foo",
+            ],
+            key_ids=[
+                ["foo1"],
+            ],
+            partitions=[
+                "aws",
+            ],
+            account_ids=[
+                ["12345"],
+            ],
+        ),
+    )
+    graph = create_object_graph(
+        name="example",
+        testing=True,
+        import_name="microcosm_postgres",
+        loader=loader,
+    )
+    encryptor = graph.multi_tenant_encryptor.encryptors["foo"]
+
+    ciphertexts = [encryptor.encrypt("foo", plaintext)[0] for plaintext in ("first", "second")]
+
+    assert_that(encryptor.decrypt_many("foo", ciphertexts), contains_exactly("first", "second"))
+
+
 def test_cycle_cache():
     loader = load_from_dict(
         materials_manager=dict(
@@ -132,16 +165,54 @@ def test_cycle_cache():
     master_key_provider = encryptor.decrypting_materials_manager.master_key_provider
     decrypt_data_key = master_key_provider.decrypt_data_key
 
+    plaintext = "The quick brown fox jumped over the lazy dog"
+    ciphertext, used_key_ids = graph.multi_tenant_encryptor.encrypt("whatever", plaintext)
+    assert_that(used_key_ids, contains_inanyorder("key1", "key2"))
+
     with patch.object(master_key_provider, "decrypt_data_key") as mocked_decrypt_data_key:
         mocked_decrypt_data_key.side_effect = decrypt_data_key
         for _ in range(5):
-            cycle(
-                encryptor=graph.multi_tenant_encryptor,
-                encryption_context_key="whatever",
-                key_ids=["key1", "key2"],
+            assert_that(
+                graph.multi_tenant_encryptor.decrypt("whatever", ciphertext),
+                is_(equal_to(plaintext)),
             )
 
     assert_that(
         mocked_decrypt_data_key.call_count,
         is_(equal_to(1)),
     )
+
+
+def test_lookup_falls_back_to_default():
+    foo, default = object(), object()
+    encryptor = MultiTenantEncryptor(encryptors=dict(foo=foo))
+
+    assert_that(encryptor["foo"], is_(foo))
+    assert_that(encryptor["bar"], is_(None))
+    assert_that("bar" in encryptor, is_(False))
+
+    encryptor.encryptors = dict(foo=foo, default=default)
+
+    assert_that(encryptor["foo"], is_(foo))
+    assert_that(encryptor["bar"], is_(default))
+    assert_that("bar" in encryptor, is_(True))
+
+
+def test_beacon_many():
+    encryptor = SingleTenantEncryptor(
+        encrypting_materials_manager=None,
+        decrypting_materials_manager=None,
+        beacon_key="beacon",
+    )
+
+    assert_that(
+        encryptor.beacon_many(["foo", "bar"], algorithm=BeaconHashAlgorithm.HMAC_SHA_256),
+        contains_exactly(
+            encryptor.beacon("foo", algorithm=BeaconHashAlgorithm.HMAC_SHA_256),
+            encryptor.beacon("bar", algorithm=BeaconHashAlgorithm.HMAC_SHA_256),
+        ),
+    )
+    assert_that(
+        encryptor.beacon("foo", algorithm=BeaconHashAlgorithm.HMAC_SHA_256),
+        is_not(equal_to(encryptor.beacon("bar", algorithm=BeaconHashAlgorithm.HMAC_SHA_256))),
+    )
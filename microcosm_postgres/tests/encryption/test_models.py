@@ -1,12 +1,11 @@
+import pytest
 from hamcrest import (
     assert_that,
-    calling,
     equal_to,
     has_properties,
     is_,
     is_not,
     none,
-    raises,
 )
 from microcosm.api import (
     create_object_graph,
@@ -14,19 +13,62 @@ from microcosm.api import (
     load_from_dict,
     load_from_environ,
 )
+from sqlalchemy import text
 
 import microcosm_postgres.encryption.factories  # noqa: F401
 from microcosm_postgres.context import SessionContext, transaction
+from microcosm_postgres.encryption.encryptor import MultiTenantEncryptor
 from microcosm_postgres.errors import ModelIntegrityError
-from microcosm_postgres.tests.encryption.fixtures.encryptable import Encryptable
-from microcosm_postgres.tests.encryption.fixtures.json_encryptable import JsonEncryptable
-from microcosm_postgres.tests.encryption.fixtures.nullable_encryptable import NullableEncryptable
-from microcosm_postgres.tests.encryption.fixtures.sub_encryptable import SubEncryptable
+from microcosm_postgres.tests.encryption.fixtures.encryptable import Encryptable, Encrypted
+from microcosm_postgres.tests.encryption.fixtures.json_encryptable import JsonEncryptable, JsonEncrypted
+from microcosm_postgres.tests.encryption.fixtures.nullable_encryptable import NullableEncryptable, NullableEncrypted
+from microcosm_postgres.tests.encryption.fixtures.sub_encryptable import Parent, SubEncryptable, SubEncrypted
+
+
+# Tables written by these tests, cleared between tests with a single statement
+TABLES = (
+    Encryptable.__table__,
+    Encrypted.__table__,
+    JsonEncryptable.__table__,
+    JsonEncrypted.__table__,
+    NullableEncryptable.__table__,
+    NullableEncrypted.__table__,
+    SubEncryptable.__table__,
+    SubEncrypted.__table__,
+    Parent.__table__,
+)
+
+
+def truncate_tables(graph, tables=TABLES):
+    """
+    Clear the given tables with one TRUNCATE.
+
+    TRUNCATE takes an ACCESS EXCLUSIVE lock: the graph's pooled connections are disposed first
+    and a lock timeout makes a session left open elsewhere fail the test instead of hanging it.
+
+    """
+    graph.postgres.dispose()
+    with graph.postgres.connect() as connection:
+        format_table = connection.dialect.identifier_preparer.format_table
+        connection.execute(text("SET LOCAL lock_timeout = '5s'"))
+        connection.execute(text(
+            f"TRUNCATE TABLE {', '.join(format_table(table) for table in tables)} RESTART IDENTITY"
+        ))
+        connection.commit()
 
 
 class TestEncryptable:
 
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
+        # make sure the schema exists once; setup_method then only clears rows
+        graph = cls.create_graph()
+        with SessionContext(graph) as context:
+            context.recreate_all()
+        graph.postgres.dispose()
+
+    @staticmethod
+    def create_graph():
         loaders = load_each(
             load_from_dict(
                 multi_tenant_key_registry=dict(
@@ -46,12 +88,15 @@ class TestEncryptable:
             ),
             load_from_environ,
         )
-        self.graph = create_object_graph(
+        return create_object_graph(
             name="example",
             testing=True,
             import_name="microcosm_postgres",
             loader=loaders,
         )
+
+    def setup_method(self):
+        self.graph = self.create_graph()
         self.encryptable_store = self.graph.encryptable_store
         self.encrypted_store = self.graph.encrypted_store
         self.sub_encrypted_store = self.graph.sub_encrypted_store
@@ -62,12 +107,27 @@ class TestEncryptable:
         self.nullable_encrypted_store = self.graph.nullable_encrypted_store
         self.encryptor = self.graph.multi_tenant_encryptor
 
-        with SessionContext(self.graph) as context:
-            context.recreate_all()
+        truncate_tables(self.graph)
 
     def teardown_method(self):
         self.graph.postgres.dispose()
 
+    def test_truncate_tables_with_session_open(self):
+        with SessionContext(self.graph):
+            with transaction():
+                self.encryptable_store.create(
+                    Encryptable(
+                        key="key",
+                        value="value",
+                    ),
+                )
+
+            truncate_tables(self.graph)
+
+            assert_that(
+                self.encryptable_store.count(), is_(equal_to(0)),
+            )
+
     def test_not_encrypted(self):
         with SessionContext(self.graph):
             with transaction():
@@ -110,6 +170,65 @@ class TestEncryptable:
                 self.encryptable_store.count(), is_(equal_to(0)),
             )
 
+    def test_register_is_idempotent(self):
+        Encryptable.register(self.encryptor)
+
+        with SessionContext(self.graph):
+            with transaction():
+                encryptable = self.encryptable_store.create(
+                    Encryptable(
+                        key="private",
+                        value="value",
+                    ),
+                )
+
+            assert_that(
+                encryptable,
+                has_properties(
+                    key=is_(equal_to("private")),
+                    value=is_(none()),
+                    encrypted_id=is_not(none()),
+                ),
+            )
+
+    def test_not_encrypted_without_encryptors(self):
+        Encryptable.register(MultiTenantEncryptor(encryptors=dict()))
+        try:
+            encryptable = Encryptable(
+                key="private",
+                value="value",
+            )
+        finally:
+            Encryptable.register(self.encryptor)
+
+        assert_that(
+            encryptable,
+            has_properties(
+                value=is_(equal_to("value")),
+                encrypted=is_(none()),
+            ),
+        )
+
+    def test_encrypted_with_encryptors_assigned_after_register(self):
+        encryptor = MultiTenantEncryptor(encryptors=dict())
+        Encryptable.register(encryptor)
+        try:
+            encryptor.encryptors = self.encryptor.encryptors
+            encryptable = Encryptable(
+                key="private",
+                value="value",
+            )
+        finally:
+            Encryptable.register(self.encryptor)
+
+        assert_that(
+            encryptable,
+            has_properties(
+                value=is_(none()),
+                encrypted=is_not(none()),
+            ),
+        )
+
     def test_encrypted(self):
         with SessionContext(self.graph):
             with transaction():
@@ -234,15 +353,13 @@ class TestEncryptable:
 
     def test_throw_model_integrity_when_value_is_none(self):
         with SessionContext(self.graph):
-            assert_that(
-                calling(self.encryptable_store.create).with_args(
+            with pytest.raises(ModelIntegrityError):
+                self.encryptable_store.create(
                     Encryptable(
                         key="private",
                         value=None,
                     ),
-                ),
-                raises(ModelIntegrityError),
-            )
+                )
 
     def test_json_encrypted(self):
         with SessionContext(self.graph):
@@ -63,6 +63,29 @@ def test_parse_config_key_ids():
     )
 
 
+def test_parse_config_optional_settings():
+    assert_that(
+        parse_config(
+            context_keys=["foo", "quux"],
+            key_ids=["bar", "quuz"],
+            partitions=["aws", "aws"],
+            account_ids=["12345", "23456"],
+            restricted_kms_policy=["true"],
+            beacon_keys=["", "beacon"],
+        ),
+        has_entries(
+            foo=has_entries(
+                beacon_key=None,
+                restricted=True,
+            ),
+            quux=has_entries(
+                beacon_key="beacon",
+                restricted=False,
+            ),
+        ),
+    )
+
+
 def test_default_encryptor_not_created_when_no_config_available():
     """
     Tests that when we have no config then we don't try to make
@@ -106,3 +129,30 @@ def test_first_beacon_key_used_in_default_encryptor():
     multi_tenant_encryptor = graph.multi_tenant_key_registry.make_encryptor(graph)
     default_encryptor = multi_tenant_encryptor.encryptors[ENCRYPTION_V2_DEFAULT_KEY]
     assert default_encryptor._beacon_key == b"beacon1"
+
+
+def test_materials_managers_built_on_first_use():
+    loader = load_from_dict(
+        multi_tenant_key_registry=dict(
+            context_keys=["foo"],
+            key_ids=["bar"],
+            partitions=["aws"],
+            account_ids=["12345"],
+        ),
+    )
+
+    graph = create_object_graph(
+        "example",
+        testing=True,
+        loader=loader,
+        import_name="microcosm_postgres",
+    )
+
+    encryptor = graph.multi_tenant_key_registry.make_encryptor(graph).encryptors["foo"]
+    assert "encrypting_materials_manager" not in vars(encryptor)
+    assert "decrypting_materials_manager" not in vars(encryptor)
+
+    ciphertext, _ = encryptor.encrypt("foo", "plaintext")
+    assert encryptor.decrypt("foo", ciphertext) == "plaintext"
+    assert "encrypting_materials_manager" in vars(encryptor)
+    assert "decrypting_materials_manager" in vars(encryptor)
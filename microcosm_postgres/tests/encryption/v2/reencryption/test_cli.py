@@ -12,7 +12,7 @@ from microcosm.api import (
     load_from_environ,
 )
 from microcosm.object_graph import ObjectGraph
-from pytest import fixture
+from pytest import fixture, raises
 from sqlalchemy import UUID, Table
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import (
@@ -29,6 +29,9 @@ from microcosm_postgres.encryption.v2.column import encryption
 from microcosm_postgres.encryption.v2.encoders import StringEncoder
 from microcosm_postgres.encryption.v2.encryptors import AwsKmsEncryptor
 from microcosm_postgres.encryption.v2.reencryption.cli import ReencryptionCli
+from microcosm_postgres.encryption.v2.reencryption.utils import (
+    reencrypt_instance,
+)
 
 
 class NewModel(DeclarativeBase):
@@ -211,6 +214,51 @@ def test_reencrypt_cli(
     assert lines[5] == "- Instances Reencrypted: 10\n"
 
 
+def test_reencrypt_cli_with_workers_and_batches(
+    graph: ObjectGraph,
+    single_tenant_encryptor: SingleTenantEncryptor,
+    reencryption_cli: ReencryptionCli
+) -> None:
+    with (
+        SessionContext(graph) as context,
+        transaction(),
+        AwsKmsEncryptor.set_encryptor_context("test", single_tenant_encryptor)
+    ):
+        context.recreate_all()
+        session = context.session
+
+        for i in range(10):
+            session.add(Employee(name=f"foo-{i}", client_id=client_id))
+
+        original_names_encrypted = {employee.id: employee.name_encrypted for employee in session.query(Employee).all()}
+
+    args_mock = SimpleNamespace(
+        client_id=str(client_id),
+        no_dry_run=True,
+        testing=True,
+        workers=2,
+        batch_size=3,
+    )
+    with captured_output() as output:
+        reencryption_cli.reencrypt(args_mock)
+
+    with (
+        SessionContext(graph) as context,
+        transaction(),
+        AwsKmsEncryptor.set_encryptor_context("test", single_tenant_encryptor)
+    ):
+        session = context.session
+        for employee in session.query(Employee).all():
+            assert employee.name_encrypted != original_names_encrypted[employee.id]
+            assert employee.name.startswith("foo-")
+
+    output.seek(0)
+    lines = output.readlines()
+    assert lines[2] == "Model: Employee\n"
+    assert lines[3] == "- Total Instances Found: 10\n"
+    assert lines[5] == "- Instances Reencrypted: 10\n"
+
+
 def test_reencrypt_cli_no_dry_run(
     graph: ObjectGraph,
     single_tenant_encryptor: SingleTenantEncryptor,
@@ -374,3 +422,26 @@ def test_audit_command_setup(
     # Assertions
     assert lines[0] == "Found 1 table(s) with encryption usage:\n"
     assert lines[1] == "Model name: Employee, Cols used: name\n"
+
+
+def test_reencrypt_instance_dry_run_stops_at_first_unencrypted_column() -> None:
+    # Only the first column is readable: the dry run must not look any further
+    instance = SimpleNamespace(first_unencrypted="foo")
+
+    assert reencrypt_instance(
+        session=None,  # type: ignore[arg-type]
+        instance=instance,
+        encryption_columns=["first", "second"],
+        dry_run=True,
+    ) == (True, False)
+
+
+def test_verify_handle_all_tables_reports_missing_models(graph: ObjectGraph) -> None:
+    reencryption_cli = ReencryptionCli(
+        instance_iterators=[],
+        base_models_mapping={NewModel: []},
+        graph=graph,
+    )
+
+    with raises(ValueError, match="missing a table\\(s\\) using encryption: Employee"):
+        reencryption_cli._verify_handle_all_tables()
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
@@ -35,6 +36,20 @@ def test_encode_decode(encoder, value):
     assert encoder.decode(encoder.encode(value)) == value
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"foo": "bär", "baz": [1, 2.5, None, True]},
+        {"big": 2 ** 70},
+        [float("inf")],
+    ],
+)
+def test_json_encoder_round_trip(value):
+    encoder = encoders.JSONEncoder()
+    assert encoder.encode(value) == json.dumps(value)
+    assert encoder.decode(encoder.encode(value)) == value
+
+
 @pytest.mark.parametrize(
     ("input", "output"),
     [
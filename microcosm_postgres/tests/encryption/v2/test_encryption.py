@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from contextvars import copy_context
 from enum import Enum
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, ClassVar, Iterator
 from uuid import uuid4
 
@@ -11,10 +13,11 @@ from microcosm.api import (
     load_from_environ,
 )
 from microcosm.object_graph import ObjectGraph
-from pytest import fixture, raises
+from pytest import fixture, importorskip, raises
 from sqlalchemy import UUID, CheckConstraint, Table
 from sqlalchemy.orm import Session, mapped_column, sessionmaker as SessionMaker
 
+from microcosm_postgres.constants import X_REQUEST_CLIENT_HEADER
 from microcosm_postgres.context import SessionContext
 from microcosm_postgres.encryption.constants import ENCRYPTION_V2_DEFAULT_KEY
 from microcosm_postgres.encryption.encryptor import MultiTenantEncryptor, SingleTenantEncryptor
@@ -190,6 +193,83 @@ def test_encrypt_no_context(session: Session) -> None:
     assert employee.name_unencrypted == "foo"
 
 
+def test_encrypt_and_decrypt_many(single_tenant_encryptor: SingleTenantEncryptor) -> None:
+    encryptor = AwsKmsEncryptor()
+    assert encryptor.encrypt_many(["foo", "bar"]) == [None, None]
+
+    with AwsKmsEncryptor.set_encryptor_context("test", single_tenant_encryptor):
+        encrypted = encryptor.encrypt_many(["foo", "bar"])
+        assert None not in encrypted
+        assert encryptor.decrypt_many(encrypted) == ["foo", "bar"]
+
+    with raises(AwsKmsEncryptor.EncryptorNotBound):
+        encryptor.decrypt_many(encrypted)
+
+
+def test_set_context_from_graph(
+    multi_tenant_encryptor: MultiTenantEncryptor,
+    single_tenant_encryptor: SingleTenantEncryptor,
+) -> None:
+    graph = SimpleNamespace(
+        multi_tenant_encryptor=multi_tenant_encryptor,
+        request_context=lambda: {X_REQUEST_CLIENT_HEADER.upper(): str(client_id)},
+    )
+    encryptor = AwsKmsEncryptor()
+
+    with AwsKmsEncryptor.set_context_from_graph(graph):
+        assert encryptor.encryptor_context == (str(client_id), single_tenant_encryptor)
+
+    assert encryptor.encryptor_context is None
+
+
+def test_register_flask_context(
+    multi_tenant_encryptor: MultiTenantEncryptor,
+    single_tenant_encryptor: SingleTenantEncryptor,
+) -> None:
+    flask = importorskip("flask")
+
+    app = flask.Flask(__name__)
+    graph = SimpleNamespace(
+        flask=app,
+        multi_tenant_encryptor=multi_tenant_encryptor,
+        request_context=lambda: dict(flask.request.headers),
+        use=lambda *args: None,
+    )
+    AwsKmsEncryptor.register_flask_context(graph)
+    encryptor = AwsKmsEncryptor()
+    contexts = []
+
+    @app.route("/")
+    def index():
+        contexts.append(encryptor.encryptor_context)
+        return ""
+
+    @app.route("/fail")
+    def fail():
+        contexts.append(encryptor.encryptor_context)
+        raise ValueError("fail")
+
+    client = app.test_client()
+    response = client.get("/fail", headers={X_REQUEST_CLIENT_HEADER: str(client_id)})
+    assert response.status_code == 500
+
+    # the failed request's context does not leak into the next one
+    assert encryptor.encryptor_context is None
+    client.get("/", headers={X_REQUEST_CLIENT_HEADER: str(client_id)})
+    assert encryptor.encryptor_context is None
+
+    assert contexts == [
+        (str(client_id), single_tenant_encryptor),
+        (str(client_id), single_tenant_encryptor),
+    ]
+
+    # a token created in another context cannot be reset; teardown clears the context instead
+    with app.test_request_context(headers={X_REQUEST_CLIENT_HEADER: str(client_id)}):
+        copy_context().run(app.preprocess_request)
+        app.do_teardown_request()
+        assert encryptor.encryptor_context is None
+
+
 def test_encrypt_with_client(
     session: Session,
     single_tenant_encryptor: SingleTenantEncryptor,
@@ -11,10 +11,13 @@ from hamcrest import (
     is_,
     starts_with,
 )
-from microcosm.api import create_object_graph
+from microcosm.api import create_object_graph, load_from_dict
+from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_VALUES_PLUS_BATCH
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.sql import text
 
+from microcosm_postgres.serialization import json_loads, orjson
+
 
 def test_configure_engine():
     """
@@ -36,3 +39,57 @@ def test_configure_engine():
     with engine.connect() as connection:
         row = connection.execute(text("SELECT 1;")).fetchone()
         assert_that(row[0], is_(equal_to(1)))
+
+
+def test_configure_engine_executemany_mode():
+    """
+    Engine factory should pass through the executemany mode.
+
+    """
+    loader = load_from_dict(
+        postgres=dict(
+            executemany_mode="values_plus_batch",
+        ),
+    )
+    graph = create_object_graph(name="example", testing=True, loader=loader)
+
+    assert_that(graph.postgres.dialect.executemany_mode, is_(equal_to(EXECUTEMANY_VALUES_PLUS_BATCH)))
+
+
+def test_configure_engine_escapes_password():
+    """
+    Engine factory should not mangle passwords with URL special characters.
+
+    """
+    loader = load_from_dict(
+        postgres=dict(
+            password="p@ss:word/",
+        ),
+    )
+    graph = create_object_graph(name="example", testing=True, loader=loader)
+
+    assert_that(graph.postgres.url.password, is_(equal_to("p@ss:word/")))
+    assert_that(graph.postgres.url.host, is_(equal_to("localhost")))
+
+
+def test_configure_engine_json_deserializer():
+    """
+    Engine factory should parse JSON results with orjson when it is installed.
+
+    """
+    graph = create_object_graph(name="example", testing=True)
+
+    expected = json_loads if orjson is not None else None
+    assert_that(graph.postgres.dialect._json_deserializer, is_(expected))
+
+
+def test_configure_engine_synchronous_commit_when_testing():
+    """
+    Engine factory should not wait for durable commits against a test database.
+
+    """
+    graph = create_object_graph(name="example", testing=True)
+
+    with graph.postgres.connect() as connection:
+        row = connection.execute(text("SHOW synchronous_commit;")).fetchone()
+        assert_that(row[0], is_(equal_to("off")))
@@ -64,6 +64,24 @@ class TestTransient:
                         is_(equal_to(3)),
                     )
 
+    def test_upsert_into_returning(self):
+        with SessionContext(self.graph):
+            with transaction():
+                # NB: create() will set the id of companies[0]
+                self.companies[0].create()
+
+            with transaction():
+                with transient(Company) as transient_company:
+                    transient_company.insert_many(self.companies)
+                    rows = transient_company.upsert_into_on_conflict_do_nothing(
+                        Company,
+                        returning=[Company.name],
+                    )
+                    assert_that(
+                        sorted(row.name for row in rows),
+                        contains_exactly("name2", "name3"),
+                    )
+
     def test_upsert_into_on_conflict_do_update(self):
         with SessionContext(self.graph):
             with transaction():
@@ -17,6 +17,7 @@ from hamcrest import (
     raises,
 )
 from microcosm.api import create_object_graph
+from sqlalchemy.event import listen
 
 from microcosm_postgres.context import SessionContext, transaction
 from microcosm_postgres.errors import DuplicateModelError, ModelNotFoundError, ReferencedModelError
@@ -54,6 +55,23 @@ class TestCompany:
         assert_that(retrieved_company.name, is_(equal_to("name")))
         assert_that(retrieved_company.type, is_(equal_to(CompanyType.private)))
 
+    def test_retrieve_company_from_identity_map(self):
+        """
+        Should not query the database when retrieving a company already in the session.
+
+        """
+        with transaction():
+            company = Company(
+                name="name",
+                type=CompanyType.private,
+            ).create()
+
+        statements = []
+        listen(SessionContext.session, "do_orm_execute", statements.append)
+
+        assert_that(Company.retrieve(company.id), is_(company))
+        assert_that(statements, is_(empty()))
+
     def test_search_company(self):
         """
         Should be able to search for companies.
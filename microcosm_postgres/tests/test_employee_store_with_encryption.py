@@ -507,6 +507,49 @@ def test_encrypt_and_search_using_beacon_with_no_beacon_key():
                 session.commit()
 
 
+def test_beacon_array_with_no_beacon_key():
+    # No beacon key is defined in the config
+    config = dict(
+        multi_tenant_key_registry=dict(
+            context_keys=[
+                str(client_id),
+            ],
+            key_ids=[
+                "key_id",
+            ],
+            partitions=[
+                "aws",
+            ],
+            account_ids=[
+                "12345",
+            ],
+        ),
+    )
+
+    graph = create_object_graph(
+        "example",
+        testing=True,
+        loader=load_each(
+            load_from_dict(config),
+            load_from_environ,
+        ),
+        import_name="microcosm_postgres",
+    )
+
+    single_tenant_encryptor = graph.multi_tenant_encryptor.encryptors[str(client_id)]
+    with AwsKmsEncryptor.set_encryptor_context("test", single_tenant_encryptor):
+        # Writes store an empty array of beacons
+        assert AwsKmsEncryptor().beacon(
+            ["foo", "bar"],
+            use_array=True,
+            algorithm=BeaconHashAlgorithm.HMAC_SHA_256,
+        ) == []
+
+        # Queries cannot match on missing beacons
+        with pytest.raises(AwsKmsEncryptor.BeaconKeyNotSet):
+            select(Employee).filter(Employee.name.in_(["foo", "bar"]))
+
+
 def test_encryptor_not_bound_when_beacon_used_without_context(
     session: Session,
     single_tenant_encryptor: SingleTenantEncryptor,
@@ -648,6 +691,30 @@ def test_search_with_array_of_beacons(
         assert len(results) == 2
 
 
+def test_search_with_tuple_of_beacons(
+    single_tenant_encryptor: SingleTenantEncryptor,
+) -> None:
+    with AwsKmsEncryptor.set_encryptor_context("test", single_tenant_encryptor):
+        query = select(Employee).filter(Employee.name.in_(("foo", "bar")))
+        params = query.compile().params
+
+    assert params["name_beacon_1"] == [
+        single_tenant_encryptor.beacon("foo", algorithm=BeaconHashAlgorithm.HMAC_SHA_256),
+        single_tenant_encryptor.beacon("bar", algorithm=BeaconHashAlgorithm.HMAC_SHA_256),
+    ]
+
+
+def test_compare_beacon_to_column_expression(
+    single_tenant_encryptor: SingleTenantEncryptor,
+) -> None:
+    with AwsKmsEncryptor.set_encryptor_context("test", single_tenant_encryptor):
+        query = select(Employee).filter(Employee.name == Employee.age)
+        assert "test_encryption_employee_v2.name_beacon = test_encryption_employee_v2.age_beacon" in str(query)
+
+        query = select(Employee).filter(Employee.name.in_(select(Employee.name_beacon)))
+        assert "test_encryption_employee_v2.name_beacon IN (SELECT" in str(query)
+
+
 def test_search_with_auto_filter_field(
     session: Session,
     single_tenant_encryptor: SingleTenantEncryptor,
@@ -0,0 +1,51 @@
+"""
+Test the UUID type.
+
+"""
+from uuid import uuid4
+
+from hamcrest import (
+    assert_that,
+    equal_to,
+    is_,
+    none,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+from microcosm_postgres.types import UUIDType
+
+
+def test_native_result_processor():
+    process = UUIDType().dialect_impl(postgresql.dialect()).result_processor(postgresql.dialect(), None)
+    value = uuid4()
+
+    assert_that(process(value), is_(value))
+    assert_that(process(str(value)), is_(equal_to(value)))
+    assert_that(process(None), is_(none()))
+
+
+def test_fallback_result_processor():
+    process = UUIDType().dialect_impl(sqlite.dialect()).result_processor(sqlite.dialect(), None)
+    value = uuid4()
+
+    assert_that(process(value.bytes), is_(equal_to(value)))
+    assert_that(process(None), is_(none()))
+
+
+def test_coerce():
+    value = uuid4()
+
+    assert_that(UUIDType._coerce(value), is_(value))
+    assert_that(UUIDType._coerce(str(value)), is_(equal_to(value)))
+    assert_that(UUIDType._coerce(value.hex), is_(equal_to(value)))
+    assert_that(UUIDType._coerce(value.bytes), is_(equal_to(value)))
+    assert_that(UUIDType._coerce(bytearray(value.bytes)), is_(equal_to(value)))
+    assert_that(UUIDType._coerce(None), is_(none()))
+
+
+def test_native_bind_param():
+    value = uuid4()
+
+    assert_that(UUIDType().process_bind_param(value, postgresql.dialect()), is_(value))
+    assert_that(UUIDType().process_bind_param(str(value), postgresql.dialect()), is_(equal_to(value)))
+    assert_that(UUIDType().process_bind_param(value, sqlite.dialect()), is_(equal_to(value.bytes)))
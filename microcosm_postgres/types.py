@@ -3,10 +3,16 @@ Custom types.
 
 """
 from enum import Enum
+from uuid import UUID
 
+import sqlalchemy_utils
 from sqlalchemy.types import TypeDecorator, Unicode, UserDefinedType
 
 
+# Dialects for which `sqlalchemy_utils.UUIDType` reads native UUID values
+NATIVE_UUID_DIALECTS = ("postgresql", "mssql", "cockroachdb")
+
+
 class EnumType(TypeDecorator):
     """
     SQLAlchemy enum type that persists the enum name (not value).
@@ -78,3 +84,59 @@ class Serial(UserDefinedType):
         def process(value):
             return value
         return process
+
+
+class UUIDType(sqlalchemy_utils.UUIDType):
+    """
+    A `sqlalchemy_utils.UUIDType` that resolves how to read UUIDs once per dialect.
+
+    The base type re-checks the dialect for every row read, coerces values via exception handling
+    and formats every bound value as a string.
+
+    """
+    cache_ok = True
+
+    @staticmethod
+    def _coerce(value):
+        """
+        Coerce strings and raw bytes to UUIDs without relying on exceptions for the common cases.
+
+        """
+        if not value or value.__class__ is UUID:
+            return value
+        if isinstance(value, str):
+            return UUID(value)
+        if isinstance(value, (bytes, bytearray)) and len(value) == 16:
+            return UUID(bytes=bytes(value))
+        return sqlalchemy_utils.UUIDType._coerce(value)
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not (self.native and dialect.name == "postgresql"):
+            return super().process_bind_param(value, dialect)
+
+        # the native postgres UUID type binds UUID objects; the driver adapts them without formatting in Python
+        return self._coerce(value)
+
+    def result_processor(self, dialect, coltype):
+        impl_processor = self.impl_instance.result_processor(dialect, coltype)
+
+        if self.native and dialect.name in NATIVE_UUID_DIALECTS:
+            def process(value):
+                if impl_processor is not None:
+                    value = impl_processor(value)
+                if value is None or isinstance(value, UUID):
+                    # drivers such as psycopg2 already return UUID objects
+                    return value
+                return UUID(value)
+            return process
+
+        if not self.binary:
+            return super().result_processor(dialect, coltype)
+
+        def process_bytes(value):
+            if impl_processor is not None:
+                value = impl_processor(value)
+            if value is None:
+                return value
+            return UUID(bytes=value)
+        return process_bytes
@@ -36,6 +36,7 @@ setup(
         "encryption": [
             "aws-encryption-sdk>=2.0.0",
             "cryptography>=35",
+            "orjson>=3.6.0",
         ],
         "test": [
             "aws-encryption-sdk>=2.0.0",